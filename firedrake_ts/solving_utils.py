@@ -95,6 +95,8 @@ class _TSContext(_SNESContext):
         self._shift = problem.shift
         # Constant to hold current time value
         self._time = problem.time
+        # Timeshift the Jacobian was last assembled with
+        self._jacobian_shift = None
 
         self.G = problem.G
         self.dGdu = problem.dGdu
@@ -227,7 +229,9 @@ class _TSContext(_SNESContext):
                 	       bcs=bcs, J=J, Jp=Jp,
                                form_compiler_parameters=problem.form_compiler_parameters,
                                G=G, time=problem.time)
-            new_problem._constant_jacobian = problem._constant_jacobian
+            # constant_jacobian is deliberately not propagated: the
+            # operators of the splits are assembled through Firedrake's
+            # compute_operators, which doesn't know about the timeshift
             splits.append(type(self)(new_problem, mat_type=self.mat_type, pmat_type=self.pmat_type,
                                      appctx=self.appctx,
                                      transfer_manager=self.transfer_manager))
@@ -283,12 +287,17 @@ class _TSContext(_SNESContext):
         problem = ctx._problem
 
         assert J.handle == ctx._jac.petscmat.handle
-        # TODO: Check how to use constant jacobian properly for TS
-        if problem._constant_jacobian and ctx._jacobian_assembled:
+        # The Jacobian is sigma*dF/du̇ + dF/du, so even a constant
+        # jacobian has to be reassembled whenever the timeshift changes.
+        # With G present PETSc may subtract the RHS Jacobian from J in
+        # place, so we can't reuse the assembled matrix then.
+        if (problem._constant_jacobian and ctx._jacobian_assembled
+                and ctx.G is None and shift == ctx._jacobian_shift):
             # Don't need to do any work with a constant jacobian
             # that's already assembled
             return
         ctx._jacobian_assembled = True
+        ctx._jacobian_shift = shift
 
         # X may not be the same vector as the vec behind self._x, so
         # copy guess in from X.
@@ -312,7 +321,7 @@ class _TSContext(_SNESContext):
             assert P.handle == ctx._pjac.petscmat.handle
             ctx._assemble_pjac(ctx._pjac)
 
-        ises = problem.J.arguments()[0].function_space()._ises
+        ises = ctx._test_ises
         ctx.set_nullspace(ctx._nullspace, ises, transpose=False, near=False)
         ctx.set_nullspace(ctx._nullspace_T, ises, transpose=True, near=False)
         ctx.set_nullspace(ctx._near_nullspace, ises, transpose=False, near=True)
@@ -379,7 +388,7 @@ class _TSContext(_SNESContext):
 
         # TODO: Add post_rhs_jacobian_callback
 
-        ises = problem.dGdu.arguments()[0].function_space()._ises
+        ises = ctx._test_ises
         ctx.set_nullspace(ctx._nullspace, ises, transpose=False, near=False)
         ctx.set_nullspace(ctx._nullspace_T, ises, transpose=True, near=False)
         ctx.set_nullspace(ctx._near_nullspace, ises, transpose=False, near=True)
@@ -418,6 +427,16 @@ class _TSContext(_SNESContext):
             assert P.handle == ctx._pjac.petscmat.handle
             ctx._assemble_pjac(ctx._pjac)
 
+    @cached_property
+    def _test_ises(self):
+        # G is tested against the same space as F, so this serves
+        # both the IJacobian and the RHS Jacobian.
+        return self._problem.J.arguments()[0].function_space()._ises
+
+    @cached_property
+    def _trial_ises(self):
+        return self._problem.J.arguments()[1].function_space()._ises
+
     @cached_property
     def _G(self):
         return cofunction.Cofunction(self.G.arguments()[0].function_space().dual())
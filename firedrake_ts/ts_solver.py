@@ -4,41 +4,54 @@ from contextlib import ExitStack
 
 from firedrake import dmhooks, slate, solving, solving_utils, ufl_expr, utils
 from firedrake import function
-from firedrake.petsc import PETSc, OptionsManager, flatten_parameters
+from firedrake.petsc import PETSc, OptionsManager
 from firedrake.bcs import DirichletBC
 
 from firedrake_ts.solving_utils import check_ts_convergence, _TSContext
 
 
+_FORM_TYPES = (ufl.BaseForm, slate.TensorBase)
+
+
 def check_pde_args(F, G, J, Jp):
-    if not isinstance(F, (ufl.BaseForm, slate.TensorBase)):
+    if not isinstance(F, _FORM_TYPES):
         raise TypeError("Provided residual is a '%s', not a BaseForm or Slate Tensor" % type(F).__name__)
     if len(F.arguments()) != 1:
         raise ValueError("Provided residual is not a linear form")
-    if G is not None and not isinstance(G, (ufl.BaseForm, slate.TensorBase)):
+    if G is not None and not isinstance(G, _FORM_TYPES):
         raise TypeError(f"Provided G residual is a '{type(G).__name__}', not a BaseForm or Slate Tensor")
     if G is not None and len(G.arguments()) != 1:
         raise ValueError("Provided G residual is not a linear form")
-    if not isinstance(J, (ufl.BaseForm, slate.TensorBase)):
+    if not isinstance(J, _FORM_TYPES):
         raise TypeError("Provided Jacobian is a '%s', not a BaseForm or Slate Tensor" % type(J).__name__)
     if len(J.arguments()) != 2:
         raise ValueError("Provided Jacobian is not a bilinear form")
-    if Jp is not None and not isinstance(Jp, (ufl.BaseForm, slate.TensorBase)):
+    if Jp is not None and not isinstance(Jp, _FORM_TYPES):
         raise TypeError("Provided preconditioner is a '%s', not a BaseForm or Slate Tensor" % type(Jp).__name__)
     if Jp is not None and len(Jp.arguments()) != 2:
         raise ValueError("Provided preconditioner is not a bilinear form")
 
 
 def is_form_consistent(is_linear, bcs):
-    # Check form style consistency
-    if not (is_linear == all(bc.is_linear for bc in bcs if not isinstance(bc, DirichletBC))
-            or not is_linear == all(not bc.is_linear for bc in bcs if not isinstance(bc, DirichletBC))):
+    # Check form style consistency: at least one of the non-Dirichlet
+    # bcs must be given in the same style as the form
+    styles = {bc.is_linear for bc in bcs if not isinstance(bc, DirichletBC)}
+    if styles and is_linear not in styles:
         raise TypeError("Form style mismatch: some forms are given in 'F == 0' style, but others are given in 'A == b' style.")
 
 
 class DAEProblem(object):
     r"""Nonlinear variational problem in DAE form F(u̇, u, t) = G(u, t)."""
 
+    # __dict__ is kept for cached properties, __weakref__ so the
+    # problem can still be weakly referenced.
+    __slots__ = (
+        "bcs", "_dirichlet_bcs", "is_linear", "Jp_eq_J", "u", "udot",
+        "tspan", "F", "G", "Jp", "time", "shift", "J", "dGdu",
+        "form_compiler_parameters", "_constant_jacobian",
+        "_constant_rhs_jacobian", "__dict__", "__weakref__",
+    )
+
     def __init__(
         self,
         F,
@@ -52,6 +65,7 @@ class DAEProblem(object):
         form_compiler_parameters=None,
         is_linear=False,
         G=None,
+        constant_jacobian=False,
     ):
         r"""
         :param F: the nonlinear form
@@ -66,16 +80,29 @@ class DAEProblem(object):
                  will be used.
         :param dict form_compiler_parameters: parameters to pass to the form
             compiler (optional)
-        :is_linear: internally used to check if all domain/bc forms
-            are given either in 'A == b' style or in 'F == 0' style.
+        :is_linear: flag indicating that F is linear in u and u̇ and that
+            J is its exact Jacobian. The solver then does a single linear
+            solve per stage (``snes_type`` defaults to ``ksponly``) without
+            checking convergence, so a nonlinear F or an approximate J
+            gives wrong results without an error. Also used to check if
+            all domain/bc forms are given either in 'A == b' style or in
+            'F == 0' style.
         :param G: G(t, u) term that will be treated explicitly
             when using an IMEX method for solving F(u̇, u, t) = G(u, t).
             If G is `None` the G(u, t) term in the equation is considered to be equal to zero.
+        :param constant_jacobian: (optional) flag indicating that dF/du and
+            dF/du̇ do not change during the solve, so the Jacobian is only
+            reassembled when the timeshift changes. Ignored if G is
+            given, since PETSc may then modify the assembled Jacobian,
+            and not passed on to field splits.
         """
         from firedrake import solving
         from firedrake import function, Constant
 
         self.bcs = solving._extract_bcs(bcs)
+        self._dirichlet_bcs = tuple(
+            chain.from_iterable(bc.dirichlet_bcs() for bc in self.bcs)
+        )
         # Check form style consistency
         self.is_linear = is_linear
         is_form_consistent(self.is_linear, self.bcs)
@@ -114,12 +141,16 @@ class DAEProblem(object):
 
         # Store form compiler parameters
         self.form_compiler_parameters = form_compiler_parameters
-        self._constant_jacobian = False
+        self._constant_jacobian = constant_jacobian
         self._constant_rhs_jacobian = False
 
     def dirichlet_bcs(self):
-        for bc in self.bcs:
-            yield from bc.dirichlet_bcs()
+        r"""Iterate over all :class:`.DirichletBC`\s of the problem.
+
+        The boundary conditions are collected once, so ``bcs`` must not
+        be modified after the problem has been constructed.
+        """
+        return iter(self._dirichlet_bcs)
 
     @utils.cached_property
     def dm(self):
@@ -250,6 +281,13 @@ class DAESolver(OptionsManager):
             # If G is provided use the arkimex solver
             self.set_default_parameter("ts_type", "arkimex")
 
+        if problem.is_linear:
+            # A single linear solve per stage is enough, there is no
+            # need for Newton to assemble the residual again just to
+            # check convergence
+            self.ts.setProblemType(PETSc.TS.ProblemType.LINEAR)
+            self.set_default_parameter("snes_type", "ksponly")
+
         self.set_default_parameter("ts_exact_final_time", "stepover")
         # allow a certain number of failures (step will be rejected and retried)
         #self.set_default_parameter("ts_max_snes_failures", 5)
@@ -265,6 +303,9 @@ class DAESolver(OptionsManager):
         with dmhooks.add_hooks(dm, self, appctx=self._ctx, save=False):
             self.set_from_options(self.ts)
 
+        # The TS DM doesn't change between solves, so only look it up once.
+        self._dm = dm
+
         # Used for custom grid transfer.
         self._transfer_operators = ()
         self._setup = False
@@ -289,19 +330,19 @@ class DAESolver(OptionsManager):
         ctx.set_rhs_jacobian(self.ts)
         ctx.set_nullspace(
             nullspace,
-            problem.J.arguments()[0].function_space()._ises,
+            ctx._test_ises,
             transpose=False,
             near=False,
         )
         ctx.set_nullspace(
             nullspace_T,
-            problem.J.arguments()[1].function_space()._ises,
+            ctx._trial_ises,
             transpose=True,
             near=False,
         )
         ctx.set_nullspace(
             near_nullspace,
-            problem.J.arguments()[0].function_space()._ises,
+            ctx._test_ises,
             transpose=False,
             near=True,
         )
@@ -309,6 +350,14 @@ class DAESolver(OptionsManager):
         ctx._nullspace_T = nullspace_T
         ctx._near_nullspace = near_nullspace
 
+    def invalidate_jacobian(self):
+        r"""Force the Jacobian to be reassembled on the next evaluation.
+
+        Only needed for problems with a constant Jacobian whose
+        coefficients have been changed between solves.
+        """
+        self._ctx._jacobian_assembled = False
+
     def set_transfer_manager(self, manager):
         r"""Set the object that manages transfer between grid levels.
         Typically a :class:`~.TransferManager` object.
@@ -318,6 +367,18 @@ class DAESolver(OptionsManager):
         """
         self._ctx.transfer_manager = manager
 
+    def _enter_solve_contexts(self, stack):
+        r"""Enter the contexts needed while the TS is running.
+        :arg stack: the :class:`~contextlib.ExitStack` to enter them on.
+        """
+        # Ensure options database has full set of options (so monitors
+        # work right)
+        stack.enter_context(self.inserted_options())
+        # Make sure appcontext is attached to the DM before we solve.
+        stack.enter_context(dmhooks.add_hooks(self._dm, self, appctx=self._ctx))
+        for ctx in self._transfer_operators:
+            stack.enter_context(ctx)
+
     def solve(self, bounds=None):
         r"""Solve the time-dependent variational problem.
         :arg bounds: Optional bounds on the solution (lower, upper).
@@ -335,8 +396,6 @@ class DAESolver(OptionsManager):
             self.nullspace_T,
             self.near_nullspace,
         )
-        # Make sure appcontext is attached to the DM before we solve.
-        dm = self.ts.getDM()
         for dbc in self._problem.dirichlet_bcs():
             dbc.apply(self._problem.u)
 
@@ -345,20 +404,14 @@ class DAESolver(OptionsManager):
             with lower.dat.vec_ro as lb, upper.dat.vec_ro as ub:
                 self.snes.setVariableBounds(lb, ub)
 
+        # TS can't integrate directly into the vec behind u: the
+        # callbacks copy the (stage) state into u, which would clobber
+        # the TS solution vector in the middle of a step.
         work = self._work
         with self._problem.u.dat.vec as u:
             u.copy(work)
             with ExitStack() as stack:
-                # Ensure options database has full set of options (so monitors
-                # work right)
-                for ctx in chain(
-                        (
-                            self.inserted_options(),
-                            dmhooks.add_hooks(dm, self, appctx=self._ctx),
-                        ),
-                        self._transfer_operators,
-                ):
-                    stack.enter_context(ctx)
+                self._enter_solve_contexts(stack)
                 self.ts.solve(work)
             work.copy(u)
         self._setup = True
@@ -374,18 +427,8 @@ class DAESolver(OptionsManager):
             self.nullspace_T,
             self.near_nullspace,
         )
-        # Make sure appcontext is attached to the DM before the adjoint solve.
-        dm = self.ts.getDM()
-
         with ExitStack() as stack:
-            for ctx in chain(
-                (
-                    self.inserted_options(),
-                    dmhooks.add_hooks(dm, self, appctx=self._ctx),
-                ),
-                self._transfer_operators,
-            ):
-                stack.enter_context(ctx)
+            self._enter_solve_contexts(stack)
             self.ts.adjointSolve()
 
         check_ts_convergence(self.ts)
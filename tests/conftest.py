@@ -0,0 +1,27 @@
+import pytest
+from firedrake import *
+import firedrake_ts
+
+
+@pytest.fixture
+def heat_problem():
+    """Return a factory for a 1D heat equation :class:`DAEProblem`."""
+
+    def make(tspan=(0.0, 0.5), kappa=1.0, **kwargs):
+        mesh = UnitIntervalMesh(10)
+        V = FunctionSpace(mesh, "P", 1)
+
+        u = Function(V)
+        u_t = Function(V)
+        v = TestFunction(V)
+        F = inner(u_t, v) * dx + kappa * inner(grad(u), grad(v)) * dx - 1.0 * v * dx
+
+        bc = DirichletBC(V, 0.0, "on_boundary")
+
+        x = SpatialCoordinate(mesh)
+        bump = conditional(lt(abs(x[0] - 0.5), 0.1), 1.0, 0.0)
+        u.interpolate(bump)
+
+        return firedrake_ts.DAEProblem(F, u, u_t, tspan, bcs=bc, **kwargs)
+
+    return make
@@ -0,0 +1,76 @@
+import pytest
+from firedrake import *
+import firedrake_ts
+
+
+def _solve(problem, params):
+    assemblies = []
+
+    def count_assemblies(X, Xdot):
+        assemblies.append(1)
+
+    solver = firedrake_ts.DAESolver(
+        problem, solver_parameters=params, pre_jacobian_callback=count_assemblies
+    )
+    solver.solve()
+    return solver, assemblies
+
+
+@pytest.mark.parametrize(
+    "tspan, exact_final_time, expected",
+    [((0.0, 0.5), "stepover", 1), ((0.0, 0.25), "matchstep", 2)],
+    ids=["fixed_dt", "changing_dt"],
+)
+def test_constant_jacobian(heat_problem, tspan, exact_final_time, expected):
+    params = {
+        "ts_type": "beuler",
+        "ts_dt": 0.1,
+        "ts_adapt_type": "none",
+        "ts_exact_final_time": exact_final_time,
+        "ksp_type": "preonly",
+        "pc_type": "lu",
+    }
+
+    problem = heat_problem(tspan)
+    _, assemblies = _solve(problem, params)
+    problem_c = heat_problem(tspan, constant_jacobian=True)
+    _, assemblies_c = _solve(problem_c, params)
+
+    # With matchstep the last step is shortened, which changes the
+    # timeshift and forces a reassembly
+    assert len(assemblies_c) == expected
+    assert len(assemblies) > len(assemblies_c)
+    assert errornorm(problem.u, problem_c.u) < 1e-10
+
+
+def test_invalidate_jacobian(heat_problem):
+    params = {
+        "ts_type": "beuler",
+        "ts_dt": 0.1,
+        "ts_adapt_type": "none",
+        "ksp_type": "preonly",
+        "pc_type": "lu",
+    }
+    kappa = Constant(1.0)
+    problem_c = heat_problem(kappa=kappa, constant_jacobian=True)
+    u0 = problem_c.u.copy(deepcopy=True)
+    solver, assemblies = _solve(problem_c, params)
+    assert len(assemblies) == 1
+
+    # Solving again with the same coefficients reuses the matrix
+    problem_c.u.assign(u0)
+    solver.ts.setTime(0.0)
+    solver.solve()
+    assert len(assemblies) == 1
+
+    # After changing a coefficient the Jacobian has to be invalidated
+    kappa.assign(2.0)
+    solver.invalidate_jacobian()
+    problem_c.u.assign(u0)
+    solver.ts.setTime(0.0)
+    solver.solve()
+    assert len(assemblies) == 2
+
+    problem = heat_problem(kappa=Constant(2.0))
+    _solve(problem, params)
+    assert errornorm(problem.u, problem_c.u) < 1e-10
@@ -0,0 +1,33 @@
+import pytest
+from firedrake import *
+import firedrake_ts
+
+
+def _solve(problem, params):
+    residuals = []
+
+    def count_residuals(X, Xdot):
+        residuals.append(1)
+
+    solver = firedrake_ts.DAESolver(
+        problem, solver_parameters=params, pre_function_callback=count_residuals
+    )
+    solver.solve()
+    return solver, residuals
+
+
+def test_linear_problem_uses_ksponly(heat_problem):
+    params = {"ts_type": "beuler", "ts_dt": 0.1, "ksp_type": "preonly", "pc_type": "lu"}
+
+    problem = heat_problem()
+    solver, residuals = _solve(problem, params)
+    assert solver.snes.getType() != "ksponly"
+
+    problem_l = heat_problem(is_linear=True)
+    solver_l, residuals_l = _solve(problem_l, params)
+    assert solver_l.snes.getType() == "ksponly"
+
+    # Newton assembles the residual again to check convergence,
+    # ksponly doesn't
+    assert len(residuals_l) < len(residuals)
+    assert errornorm(problem.u, problem_l.u) < 1e-10